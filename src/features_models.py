@@ -1,6 +1,9 @@
 import os
+import joblib
 import pandas as pd
 
+from label_calamity import flag_for_review
+
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.model_selection import train_test_split
 from sklearn.naive_bayes import MultinomialNB
@@ -26,7 +29,9 @@ def main():
     BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     input_path = os.path.join(BASE_DIR, "data", "processed", "news_labeled.csv")
     results_dir = os.path.join(BASE_DIR, "results")
+    models_dir = os.path.join(BASE_DIR, "data", "models")
     os.makedirs(results_dir, exist_ok=True)
+    os.makedirs(models_dir, exist_ok=True)
 
     print("Loading dataset:", input_path)
     df = pd.read_csv(input_path)
@@ -36,13 +41,22 @@ def main():
     # -----------------------------
     print("Initial rows:", len(df))
 
-    # Remove "unknown" labels
-    df = df[df["calamity_label"] != "unknown"].copy()
+    # Files labeled before review flags existed
+    if "keyword_label" not in df.columns:
+        df = flag_for_review(df)
+
     df = df.dropna(subset=["text_lemma"])
+
+    # Labels accepted by relabel_model.py (only used for training)
+    model_df = df[df["label_source"] == "model"]
+
+    # Remove "unknown" keyword labels. The split is made on keyword labels
+    # (tied rows included), so the test set matches earlier reports
+    df = df[df["keyword_label"] != "unknown"].copy()
     print("Rows after removing 'unknown' and NaNs:", len(df))
 
     X = df["text_lemma"].astype(str)
-    y = df["calamity_label"].astype(str)
+    y = df["keyword_label"].astype(str)
 
     print("\nLabel distribution:")
     print(y.value_counts())
@@ -56,6 +70,19 @@ def main():
         stratify=y
     )
 
+    # Tied keyword labels stay in the test set but are not trained on,
+    # since relabel_model.py re-scores them with this model
+    train_rows = df.loc[X_train.index]
+    keep = (train_rows["label_source"] == "keyword") & ~train_rows["needs_review"].astype(bool)
+    X_train, y_train = X_train[keep], y_train[keep]
+    print("\nTied rows left out of training:", int((~keep).sum()))
+
+    # Model labels go into training only, never into the test set
+    model_df = model_df.drop(index=X_test.index, errors="ignore")
+    X_train = pd.concat([X_train, model_df["text_lemma"].astype(str)])
+    y_train = pd.concat([y_train, model_df["calamity_label"].astype(str)])
+    print("Model-labeled rows added to training:", len(model_df))
+
     print("\nTrain size:", len(X_train))
     print("Test size:", len(X_test))
 
@@ -101,6 +128,11 @@ def main():
     print("Accuracy:", acc_lr)
     print(report_lr)
 
+    # Keep the fitted vectorizer + LR model for the relabel stage
+    model_path = os.path.join(models_dir, "lr_tfidf.joblib")
+    joblib.dump({"vectorizer": vectorizer, "model": lr_model}, model_path)
+    print("Saved Logistic Regression model →", model_path)
+
     # -----------------------------
     # Save reports to a text file
     # -----------------------------
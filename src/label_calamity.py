@@ -14,9 +14,9 @@ CALAMITY_KEYWORDS = {
 
 
 # ---------------------------------------
-# Label assignment function
+# Keyword scoring
 # ---------------------------------------
-def assign_label(text):
+def keyword_scores(text):
     text = text.lower()
     scores = {c: 0 for c in CALAMITY_KEYWORDS}
 
@@ -26,12 +26,75 @@ def assign_label(text):
             if w in text:
                 scores[calamity] += 1
 
+    return scores
+
+
+# ---------------------------------------
+# Label assignment functions
+# ---------------------------------------
+def score_label(text):
+    scores = keyword_scores(text)
+
     # Pick calamity with highest score
     best = max(scores, key=scores.get)
 
     if scores[best] == 0:
-        return "unknown"
-    return best
+        return "unknown", False
+
+    # Tie: two or more calamities share the top score
+    tie = list(scores.values()).count(scores[best]) > 1
+    return best, tie
+
+
+def assign_label(text):
+    return score_label(text)[0]
+
+
+def flag_for_review(df):
+    # Keyword label per row, plus a review flag for unknown or tied
+    # labels that the relabel stage (relabel_model.py) re-scores
+    results = df["text_clean"].astype(str).apply(score_label)
+
+    df["calamity_label"] = [label for label, _ in results]
+    df["keyword_label"] = df["calamity_label"]
+    df["label_source"] = "keyword"
+    df["needs_review"] = [label == "unknown" or tie for label, tie in results]
+    return df
+
+
+# Columns identifying an article across pipeline runs
+ARTICLE_KEY = ["url", "title"]
+
+
+def keep_model_labels(df, previous):
+    # Carry accepted model labels from an earlier labeled file over to
+    # rows whose keyword label still needs review
+    if "label_source" not in previous.columns:
+        return df
+
+    # Rows missing a url or title cannot be matched reliably
+    model_rows = previous[previous["label_source"] == "model"]
+    model_rows = model_rows.dropna(subset=ARTICLE_KEY)
+    if model_rows.empty:
+        return df
+
+    model_rows = model_rows.drop_duplicates(subset=ARTICLE_KEY)
+    model_rows = model_rows.reindex(
+        columns=ARTICLE_KEY + ["calamity_label", "label_confidence"]
+    )
+
+    merged = df[ARTICLE_KEY].merge(
+        model_rows, on=ARTICLE_KEY, how="left", suffixes=("", "_model")
+    )
+    carried = (merged["calamity_label"].notna() & df["needs_review"]).to_numpy()
+
+    df.loc[carried, "calamity_label"] = merged.loc[carried, "calamity_label"].to_numpy()
+    df.loc[carried, "label_confidence"] = merged.loc[carried, "label_confidence"].to_numpy()
+    df.loc[carried, "label_source"] = "model"
+    df.loc[carried, "needs_review"] = False
+
+    print("Kept model labels from previous run:", int(carried.sum()))
+    return df
 
 
 # ---------------------------------------
@@ -47,7 +110,11 @@ def main():
 
     # Use the clean text for keyword matching
     print("Assigning calamity labels...")
-    df["calamity_label"] = df["text_clean"].astype(str).apply(assign_label)
+    df = flag_for_review(df)
+
+    # Re-running this stage must not discard labels accepted by relabel_model.py
+    if os.path.exists(output_path):
+        df = keep_model_labels(df, pd.read_csv(output_path))
 
     # Save output
     df.to_csv(output_path, index=False)
@@ -56,6 +123,7 @@ def main():
 
     print("\nLabel distribution:")
     print(df["calamity_label"].value_counts())
+    print("Rows needing review (unknown or tied):", int(df["needs_review"].sum()))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+import os
+import joblib
+import numpy as np
+import pandas as pd
+
+from label_calamity import flag_for_review
+
+# Minimum predict_proba for a model label to be accepted
+CONFIDENCE_THRESHOLD = 0.7
+
+# Rows scored per predict_proba call
+BATCH_SIZE = 1000
+
+
+# ---------------------------------------
+# Batched scoring
+# ---------------------------------------
+def predict_in_batches(texts, vectorizer, model, batch_size=BATCH_SIZE):
+    labels = []
+    confidences = []
+
+    for start in range(0, len(texts), batch_size):
+        batch = texts[start:start + batch_size]
+        proba = model.predict_proba(vectorizer.transform(batch))
+        best = proba.argmax(axis=1)
+        labels.extend(model.classes_[best])
+        confidences.extend(proba[np.arange(len(best)), best])
+
+    return labels, confidences
+
+
+# ---------------------------------------
+# Main pipeline
+# ---------------------------------------
+def main():
+    base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    labeled_path = os.path.join(base_dir, "data", "processed", "news_labeled.csv")
+    review_path = os.path.join(base_dir, "data", "processed", "news_review.csv")
+    model_path = os.path.join(base_dir, "data", "models", "lr_tfidf.joblib")
+
+    print("Loading:", labeled_path)
+    df = pd.read_csv(labeled_path)
+
+    print("Loading model:", model_path)
+    saved = joblib.load(model_path)
+    vectorizer, model = saved["vectorizer"], saved["model"]
+
+    # Files labeled before this stage existed have no review flags yet
+    if "keyword_label" not in df.columns:
+        df = flag_for_review(df)
+
+    # Only the uncertain subset is re-scored on each iteration
+    uncertain = df["needs_review"].astype(bool) & df["text_lemma"].notna()
+    print("Rows to re-score:", int(uncertain.sum()))
+
+    if uncertain.any():
+        texts = df.loc[uncertain, "text_lemma"].astype(str).tolist()
+        labels, confidences = predict_in_batches(texts, vectorizer, model)
+
+        scored = df.loc[uncertain].index
+        df.loc[scored, "label_confidence"] = confidences
+
+        mask = np.array(confidences) >= CONFIDENCE_THRESHOLD
+        confident = scored[mask]
+        df.loc[confident, "calamity_label"] = np.array(labels)[mask]
+        df.loc[confident, "label_source"] = "model"
+        df.loc[confident, "needs_review"] = False
+
+        print(f"Assigned by model (confidence >= {CONFIDENCE_THRESHOLD}):", len(confident))
+
+    # Save output
+    df.to_csv(labeled_path, index=False)
+    print("\nRelabeling complete!")
+    print("Saved →", labeled_path)
+
+    # Ambiguous remainder goes to review / the next iteration
+    review = df[df["needs_review"].astype(bool)]
+    review.to_csv(review_path, index=False)
+    print("Rows still needing review:", len(review))
+    print("Saved →", review_path)
+
+    print("\nLabel distribution:")
+    print(df["calamity_label"].value_counts())
+
+
+if __name__ == "__main__":
+    main()